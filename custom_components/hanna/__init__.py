@@ -1,38 +1,247 @@
 """Hanna Cloud Integration for Home Assistant."""
 import asyncio
+import base64
 import logging
+import os
+import string
+import time
 from datetime import timedelta
+from operator import itemgetter
+from typing import Any
 
 import async_timeout
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.ssl import get_default_context
 
-from .const import DOMAIN, CONF_UPDATE_INTERVAL
+from .const import DOMAIN, CONF_UPDATE_INTERVAL, DEVICES_REFRESH_INTERVAL
 
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+_get_did = itemgetter("DID")
+
+# IVs are sent verbatim on the wire, so they must stay printable (letters + digits).
+# The translation table maps random bytes onto that alphabet in one C call; bytes at or
+# above the largest multiple of the alphabet size are dropped so every character is equally likely.
+_IV_ALPHABET = (string.ascii_letters + string.digits).encode()
+_IV_TABLE = bytes(_IV_ALPHABET[b % len(_IV_ALPHABET)] for b in range(256))
+_IV_REJECT = bytes(range(256 - 256 % len(_IV_ALPHABET), 256))
+
+# The AES key found in Hanna Cloud JavaScript
+_AES_KEY = base64.b64decode("MzJmODBmMDU0ZTAyNDFjYWM0YTVhOGQxY2ZlZTkwMDM=")
+
+try:
+    from Crypto.Cipher import AES as _AES
+    from Crypto.Util.Padding import pad as _pad
+
+    _BLOCK = _AES.block_size
+    # ECB mode is stateless, so one key-scheduled cipher can be shared by every
+    # encryption; CBC chaining is done by hand in hanna_encrypt
+    _ECB = _AES.new(_AES_KEY, _AES.MODE_ECB)
+    _CRYPTO_OK = True
+except ImportError:
+    _CRYPTO_OK = False
+
+
+def random_iv() -> bytes:
+    """Generate a 16-character random IV (letters + digits)."""
+    iv = b""
+    while len(iv) < 16:
+        iv += os.urandom(24).translate(_IV_TABLE, _IV_REJECT)
+    return iv[:16]
+
+
+def hanna_encrypt(plaintext: str, iv_bytes: bytes) -> str:
+    """Encrypt credentials using Hanna Cloud method (AES-256-CBC)."""
+    padded = _pad(plaintext.encode(), _BLOCK)
+    encrypted = bytearray()
+    prev = int.from_bytes(iv_bytes, "big")
+    for start in range(0, len(padded), _BLOCK):
+        block = _ECB.encrypt(
+            (int.from_bytes(padded[start:start + _BLOCK], "big") ^ prev).to_bytes(_BLOCK, "big")
+        )
+        prev = int.from_bytes(block, "big")
+        encrypted += block
+
+    # Return IV:encrypted_hex
+    return f"{iv_bytes.decode()}:{encrypted.hex()}"
+
+
+# Encrypted credentials are reused for re-logins within this many seconds
+_ENCRYPTED_CREDENTIALS_TTL = 3600
+
+
+def _encrypt_pair(email: str, password: str) -> tuple[str, str]:
+    """Encrypt email and password; runs in the executor."""
+    return hanna_encrypt(email, random_iv()), hanna_encrypt(password, random_iv())
+
+
+# GraphQL queries are whitespace-collapsed once at import to keep request bodies small
+_LOGIN_QUERY = " ".join("""query Login($email: String!, $password: String!, $userLanguage: String!, $source: String) {
+    login(
+        email: $email
+        password: $password
+        language: $userLanguage
+        source: $source
+    ) {
+        token
+        tokenType
+        __typename
+    }
+}""".split())
+
+_LOGIN_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "*/*",
+    "Accept-Language": "en-US,en;q=0.9,de;q=0.8",
+    "Origin": "https://hannacloud.com",
+    "Referer": "https://hannacloud.com/login",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+    "Connection": "keep-alive"
+}
+
+_DEVICES_QUERY = " ".join("""query Devices($modelGroups: [String!], $deviceLogs: Boolean!) {
+    devices(modelGroups: $modelGroups, deviceLogs: $deviceLogs) {
+        _id
+        DID
+        DM
+        modelGroup
+        DT
+        DINFO {
+            deviceName
+            deviceVersion
+            userId
+            emailId
+            assignedUsers {
+                emailId
+                __typename
+            }
+            tankId
+            tankName
+            __typename
+        }
+        parentId
+        childDevices {
+            DID
+            __typename
+        }
+        dashboardViewStatus
+        deviceOrder
+        secondaryUser
+        reportedSettings
+        status
+        lastUpdated
+        message
+        deviceName
+        batteryStatus
+        __typename
+    }
+}""".split())
+
+# The devices request never changes, so it is serialized once
+_DEVICES_BODY = _json_dumps({
+    "operationName": "Devices",
+    "variables": {
+        "modelGroups": ["BL12x", "BL13x", "BL13xs"],
+        "deviceLogs": True
+    },
+    "query": _DEVICES_QUERY
+})
+
+_READINGS_QUERY = " ".join("""query GetLastDeviceReading($deviceIds: [String!]) {
+    lastDeviceReadings(deviceIds: $deviceIds) {
+        DID
+        DT
+        messages
+        __typename
+    }
+}""".split())
+
+_READINGS_QUERY_TEMPLATE = {
+    "operationName": "GetLastDeviceReading",
+    "variables": None,
+    "query": _READINGS_QUERY
+}
+
+# Headers shared by all GraphQL requests; Authorization is added per request
+_GRAPHQL_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "*/*",
+    "Origin": "https://hannacloud.com",
+    "Referer": "https://hannacloud.com/dashboard",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
+}
+
+
+def _normalize_readings(readings: dict) -> None:
+    """Give every reading the same "messages" shape so sensors can skip type checks.
+
+    messages, status, lastDosedVolumes and glp are always dicts, and the
+    "parameters" list is indexed as a name -> value dict in _params_by_name.
+    """
+    for reading in readings.values():
+        messages = reading.get("messages")
+        if not isinstance(messages, dict):
+            messages = reading["messages"] = {}
+        for key in ("status", "lastDosedVolumes", "glp"):
+            if not isinstance(messages.get(key), dict):
+                messages[key] = {}
+
+        by_name = {}
+        parameters = messages.get("parameters")
+        if isinstance(parameters, list):
+            for param in parameters:
+                # Keep the first entry per name, like the previous linear scan
+                if isinstance(param, dict) and param.get("value") is not None:
+                    by_name.setdefault(param.get("name"), param["value"])
+        messages["_params_by_name"] = by_name
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Hanna Cloud from a config entry."""
     coordinator = HannaCloudCoordinator(hass, entry)
 
+    async def _async_close_session(_event: Event) -> None:
+        """Close the coordinator's session, which entry unload never does on shutdown."""
+        await coordinator.api.close()
+
     try:
         await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryNotReady:
+
+        hass.data.setdefault(DOMAIN, {})
+        hass.data[DOMAIN][entry.entry_id] = coordinator
+
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except BaseException:
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
         await coordinator.api.close()
         raise
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
     return True
 
 
@@ -44,52 +253,88 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+class HannaCloudConnectionError(Exception):
+    """Error to indicate Hanna Cloud did not give a usable answer."""
+
+
+class HannaCloudCryptoError(HannaCloudConnectionError):
+    """Error to indicate pycryptodome is missing, so credentials cannot be encrypted."""
+
+
 class HannaCloudAPI:
     """API client for Hanna Cloud."""
 
-    def __init__(self, session: aiohttp.ClientSession, email: str, password: str):
+    __slots__ = (
+        "hass",
+        "session",
+        "_owns_session",
+        "email",
+        "password",
+        "token",
+        "_auth_lock",
+        "_cached_encrypted",
+        "_encrypted_at",
+        "base_url",
+        "_auth_url",
+        "_graphql_url",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: aiohttp.ClientSession,
+        email: str,
+        password: str,
+        owns_session: bool = False,
+    ):
         """Initialize the API client."""
+        self.hass = hass
         self.session = session
+        self._owns_session = owns_session
         self.email = email
         self.password = password
         self.token = None
+        # Serializes logins so concurrent requests hitting an expired token log in once
+        self._auth_lock = asyncio.Lock()
+        self._cached_encrypted: tuple[str, str] | None = None
+        self._encrypted_at = 0.0
         self.base_url = "https://hannacloud.com/api"
+        self._auth_url = f"{self.base_url}/auth"
+        self._graphql_url = f"{self.base_url}/graphql"
 
     async def authenticate(self) -> bool:
-        """Authenticate with the Hanna Cloud API using proper encryption."""
-        import base64
-        import random
-        import string
-
-        # The AES key found in Hanna Cloud JavaScript
-        key_base64 = "MzJmODBmMDU0ZTAyNDFjYWM0YTVhOGQxY2ZlZTkwMDM="
-
-        try:
-            from Crypto.Cipher import AES
-            from Crypto.Util.Padding import pad
-        except ImportError:
+        """Authenticate with the Hanna Cloud API using proper encryption.
+
+        Returns False if the credentials are rejected. Timeouts and connection
+        errors are raised to the caller, as is HannaCloudConnectionError for
+        server errors and responses that cannot be parsed.
+        """
+        async with self._auth_lock:
+            return await self._login()
+
+    async def _login(self) -> bool:
+        """Log in and store the token; the caller must hold _auth_lock."""
+        if not _CRYPTO_OK:
             _LOGGER.error("pycryptodome is required for Hanna Cloud authentication")
-            return False
-
-        def hanna_encrypt(plaintext: str) -> str:
-            """Encrypt credentials using Hanna Cloud method."""
-            key = base64.b64decode(key_base64)
-
-            # Generate 16-character random IV (letters + digits)
-            chars = string.ascii_letters + string.digits
-            iv = "".join(random.choice(chars) for _ in range(16))
-
-            # AES-256-CBC encryption
-            cipher = AES.new(key, AES.MODE_CBC, iv.encode())
-            padded = pad(plaintext.encode(), AES.block_size)
-            encrypted = cipher.encrypt(padded)
-
-            # Return IV:encrypted_hex
-            return f"{iv}:{encrypted.hex()}"
+            raise HannaCloudCryptoError("pycryptodome is not installed")
+
+        # Try a recently accepted pair first; it is only kept again if the server accepts it
+        encrypted = self._cached_encrypted
+        self._cached_encrypted = None
+        if encrypted is not None and time.monotonic() - self._encrypted_at <= _ENCRYPTED_CREDENTIALS_TTL:
+            if await self._post_login(encrypted):
+                return True
+            _LOGGER.debug("Reused encrypted credentials were rejected, retrying with fresh ones")
+
+        encrypted = await self.hass.async_add_executor_job(
+            _encrypt_pair, self.email, self.password
+        )
+        self._encrypted_at = time.monotonic()
+        return await self._post_login(encrypted)
 
-        # Encrypt credentials
-        encoded_email = hanna_encrypt(self.email)
-        encoded_password = hanna_encrypt(self.password)
+    async def _post_login(self, encrypted: tuple[str, str]) -> bool:
+        """Send one login request with the given encrypted email and password."""
+        encoded_email, encoded_password = encrypted
 
         login_query = {
             "operationName": "Login",
@@ -99,31 +344,7 @@ class HannaCloudAPI:
                 "userLanguage": "German",
                 "source": "web"
             },
-            "query": """query Login($email: String!, $password: String!, $userLanguage: String!, $source: String) {
-                login(
-                    email: $email
-                    password: $password
-                    language: $userLanguage
-                    source: $source
-                ) {
-                    token
-                    tokenType
-                    __typename
-                }
-            }"""
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "*/*",
-            "Accept-Language": "en-US,en;q=0.9,de;q=0.8",
-            "Origin": "https://hannacloud.com",
-            "Referer": "https://hannacloud.com/login",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-origin",
-            "Connection": "keep-alive"
+            "query": _LOGIN_QUERY
         }
 
         _LOGGER.debug("Attempting authentication with encrypted credentials")
@@ -132,228 +353,172 @@ class HannaCloudAPI:
         try:
             async with async_timeout.timeout(15):
                 async with self.session.post(
-                    f"{self.base_url}/auth",
-                    json=login_query,
-                    headers=headers
+                    self._auth_url,
+                    data=_json_dumps(login_query),
+                    headers=_LOGIN_HEADERS
                 ) as response:
-                    response_text = await response.text()
+                    raw = await response.read()
                     _LOGGER.debug("Auth response status: %s", response.status)
-                    _LOGGER.debug("Auth response text: %s", response_text[:1000])
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Auth response text: %s", raw[:1000].decode("utf-8", "replace"))
 
                     if response.status == 200:
                         try:
-                            data = await response.json()
+                            data = _json_loads(raw)
                             _LOGGER.debug("Authentication response: %s", data)
 
                             # Check for errors first
-                            if "errors" in data and data["errors"]:
-                                error_msg = data["errors"][0].get("message", "Unknown error")
-                                _LOGGER.error("API returned error: %s", error_msg)
+                            if errors := data.get("errors"):
+                                _LOGGER.error("API returned error: %s", errors[0].get("message", "Unknown error"))
                                 return False
 
-                            # Handle both array and object responses
-                            if (data and "data" in data and data["data"] and "login" in data["data"]):
-                                login_data = data["data"]["login"]
-                                token = None
-
-                                if isinstance(login_data, list) and len(login_data) > 0:
-                                    # Array response (what we expect)
-                                    token = login_data[0].get("token")
-                                elif isinstance(login_data, dict):
-                                    # Object response (fallback)
-                                    token = login_data.get("token")
-
-                                if token:
-                                    self.token = token
-                                    _LOGGER.info("Successfully authenticated with Hanna Cloud using encrypted credentials")
-                                    return True
-                                else:
-                                    _LOGGER.error("No token found in login data: %s", login_data)
-                                    return False
-                            else:
+                            login_data = (data.get("data") or {}).get("login")
+                            if not login_data:
                                 _LOGGER.error("No login data in response: %s", data)
                                 return False
 
+                            # Handle both array (what we expect) and object responses
+                            if isinstance(login_data, list):
+                                login_data = login_data[0]
+                            token = login_data.get("token") if isinstance(login_data, dict) else None
+
+                            if not token:
+                                _LOGGER.error("No token found in login data: %s", login_data)
+                                return False
+
+                            self.token = token
+                            self._cached_encrypted = encrypted
+                            _LOGGER.info("Successfully authenticated with Hanna Cloud using encrypted credentials")
+                            return True
+
                         except Exception as json_err:
                             _LOGGER.error("Failed to parse JSON response: %s", json_err)
-                            _LOGGER.error("Raw response: %s", response_text)
-                            return False
+                            _LOGGER.error("Raw response: %s", raw.decode("utf-8", "replace"))
+                            raise HannaCloudConnectionError("Unparsable authentication response") from json_err
                     else:
-                        _LOGGER.error("Authentication failed with status %s: %s", response.status, response_text)
-                        return False
+                        _LOGGER.error(
+                            "Authentication failed with status %s: %s",
+                            response.status,
+                            raw.decode("utf-8", "replace")
+                        )
+                        if response.status in (401, 403):
+                            return False
+                        raise HannaCloudConnectionError(f"Authentication failed with status {response.status}")
 
         except asyncio.TimeoutError:
             _LOGGER.error("Timeout during authentication")
-            return False
-        except Exception as err:
-            _LOGGER.error("Error during authentication: %s", err)
-            return False
+            raise
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Connection error during authentication: %s", err)
+            raise
 
     async def get_devices(self) -> list:
         """Get all devices from the API."""
-        if not self.token:
-            if not await self.authenticate():
-                raise UpdateFailed("Authentication failed")
-
-        devices_query = {
-            "operationName": "Devices",
-            "variables": {
-                "modelGroups": ["BL12x", "BL13x", "BL13xs"],
-                "deviceLogs": True
-            },
-            "query": """query Devices($modelGroups: [String!], $deviceLogs: Boolean!) {
-                devices(modelGroups: $modelGroups, deviceLogs: $deviceLogs) {
-                    _id
-                    DID
-                    DM
-                    modelGroup
-                    DT
-                    DINFO {
-                        deviceName
-                        deviceVersion
-                        userId
-                        emailId
-                        assignedUsers {
-                            emailId
-                            __typename
-                        }
-                        tankId
-                        tankName
-                        __typename
-                    }
-                    parentId
-                    childDevices {
-                        DID
-                        __typename
-                    }
-                    dashboardViewStatus
-                    deviceOrder
-                    secondaryUser
-                    reportedSettings
-                    status
-                    lastUpdated
-                    message
-                    deviceName
-                    batteryStatus
-                    __typename
-                }
-            }"""
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "*/*",
-            "Authorization": f"Bearer {self.token}",
-            "Origin": "https://hannacloud.com",
-            "Referer": "https://hannacloud.com/dashboard",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
-        }
+        token = await self._ensure_token()
+        headers = {**_GRAPHQL_HEADERS, "Authorization": f"Bearer {token}"}
 
         try:
             async with async_timeout.timeout(10):
-                async with self.session.post(
-                        f"{self.base_url}/graphql",
-                        json=devices_query,
-                        headers=headers
-                ) as response:
-                    response_text = await response.text()
-                    _LOGGER.debug("Devices response status: %s", response.status)
-                    _LOGGER.debug("Devices response: %s", response_text[:1000])
-
-                    if response.status == 200:
-                        data = await response.json()
-                        if "data" in data and "devices" in data["data"]:
-                            return data["data"]["devices"]
-                        elif "errors" in data:
-                            error_msg = data["errors"][0].get("message", "Unknown GraphQL error")
-                            _LOGGER.error("GraphQL error getting devices: %s", error_msg)
-                            raise UpdateFailed(f"GraphQL error: {error_msg}")
-                        else:
+                for attempt in (0, 1):
+                    async with self.session.post(
+                            self._graphql_url,
+                            data=_DEVICES_BODY,
+                            headers=headers
+                    ) as response:
+                        raw = await response.read()
+                        _LOGGER.debug("Devices response status: %s", response.status)
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug("Devices response: %s", raw[:1000].decode("utf-8", "replace"))
+
+                        if response.status == 200:
+                            data = _json_loads(raw)
+                            devices = (data.get("data") or {}).get("devices")
+                            if devices is not None:
+                                return devices
+                            if errors := data.get("errors"):
+                                error_msg = errors[0].get("message", "Unknown GraphQL error")
+                                _LOGGER.error("GraphQL error getting devices: %s", error_msg)
+                                raise UpdateFailed(f"GraphQL error: {error_msg}")
                             _LOGGER.error("Unexpected devices response: %s", data)
                             raise UpdateFailed("Unexpected response format")
 
-                    # Token might be expired - handle both 401 and 403
-                    if response.status in [401, 403]:
-                        _LOGGER.info("Token expired (HTTP %s), attempting to re-authenticate", response.status)
-                        self.token = None
-                        if await self.authenticate():
-                            _LOGGER.info("Re-authentication successful, retrying request")
-                            return await self.get_devices()
-                        else:
-                            _LOGGER.error("Re-authentication failed")
-                            raise UpdateFailed("Re-authentication failed")
-
-                    _LOGGER.error("Failed to get devices: HTTP %s - %s", response.status, response_text)
-                    raise UpdateFailed(f"Failed to get devices: {response.status}")
+                        # Token might be expired - handle both 401 and 403
+                        if response.status in (401, 403) and attempt == 0:
+                            _LOGGER.info("Token expired (HTTP %s), attempting to re-authenticate", response.status)
+                            await self._reauthenticate(headers)
+                            continue
+
+                        _LOGGER.error(
+                            "Failed to get devices: HTTP %s - %s",
+                            response.status,
+                            raw.decode("utf-8", "replace")
+                        )
+                        raise UpdateFailed(f"Failed to get devices: {response.status}")
         except asyncio.TimeoutError:
             raise UpdateFailed("Timeout getting devices")
 
-    async def get_device_readings(self, device_ids: list) -> dict:
+    async def get_device_readings(self, device_ids: tuple[str, ...]) -> dict:
         """Get the latest readings for specified devices."""
-        if not self.token:
-            if not await self.authenticate():
-                raise UpdateFailed("Authentication failed")
-
-        readings_query = {
-            "operationName": "GetLastDeviceReading",
-            "variables": {
-                "deviceIds": device_ids
-            },
-            "query": """query GetLastDeviceReading($deviceIds: [String!]) {
-                lastDeviceReadings(deviceIds: $deviceIds) {
-                    DID
-                    DT
-                    messages
-                    __typename
-                }
-            }"""
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "*/*",
-            "Authorization": f"Bearer {self.token}",
-            "Origin": "https://hannacloud.com",
-            "Referer": "https://hannacloud.com/dashboard",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
-        }
+        token = await self._ensure_token()
+        body = _json_dumps({**_READINGS_QUERY_TEMPLATE, "variables": {"deviceIds": device_ids}})
+        headers = {**_GRAPHQL_HEADERS, "Authorization": f"Bearer {token}"}
 
         try:
             async with async_timeout.timeout(10):
-                async with self.session.post(
-                        f"{self.base_url}/graphql",
-                        json=readings_query,
-                        headers=headers
-                ) as response:
-                    response_text = await response.text()
-                    _LOGGER.debug("Device readings response status: %s", response.status)
-                    _LOGGER.debug("Device readings response: %s", response_text[:2000])
-
-                    if response.status == 200:
-                        data = await response.json()
-                        if "data" in data and "lastDeviceReadings" in data["data"]:
-                            readings_dict = {reading["DID"]: reading for reading in data["data"]["lastDeviceReadings"]}
-                            _LOGGER.debug("Processed readings dict: %s", readings_dict)
-                            return readings_dict
-
-                    # Token might be expired - handle both 401 and 403
-                    if response.status in [401, 403]:
-                        _LOGGER.info("Token expired (HTTP %s), attempting to re-authenticate", response.status)
-                        self.token = None
-                        if await self.authenticate():
-                            _LOGGER.info("Re-authentication successful, retrying request")
-                            return await self.get_device_readings(device_ids)
-                        else:
-                            _LOGGER.error("Re-authentication failed")
-                            raise UpdateFailed("Re-authentication failed")
-
-                    raise UpdateFailed(f"Failed to get device readings: {response.status}")
+                for attempt in (0, 1):
+                    async with self.session.post(
+                            self._graphql_url,
+                            data=body,
+                            headers=headers
+                    ) as response:
+                        raw = await response.read()
+                        _LOGGER.debug("Device readings response status: %s", response.status)
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug("Device readings response: %s", raw[:2000].decode("utf-8", "replace"))
+
+                        if response.status == 200:
+                            data = _json_loads(raw)
+                            readings = (data.get("data") or {}).get("lastDeviceReadings")
+                            if readings is not None:
+                                readings_dict = dict(zip(map(_get_did, readings), readings))
+                                _LOGGER.debug("Processed readings dict: %s", readings_dict)
+                                return readings_dict
+
+                        # Token might be expired - handle both 401 and 403
+                        if response.status in (401, 403) and attempt == 0:
+                            _LOGGER.info("Token expired (HTTP %s), attempting to re-authenticate", response.status)
+                            await self._reauthenticate(headers)
+                            continue
+
+                        raise UpdateFailed(f"Failed to get device readings: {response.status}")
         except asyncio.TimeoutError:
             raise UpdateFailed("Timeout getting device readings")
 
+    async def _ensure_token(self) -> str:
+        """Return the current token, logging in first if there is none."""
+        async with self._auth_lock:
+            if not self.token and not await self._login():
+                raise UpdateFailed("Authentication failed")
+            return self.token
+
+    async def _reauthenticate(self, headers: dict[str, str]) -> None:
+        """Replace the token the request was rejected with and update its headers."""
+        async with self._auth_lock:
+            if self.token and headers["Authorization"] != f"Bearer {self.token}":
+                # A concurrent request already logged in again while this one waited
+                _LOGGER.debug("Token was already refreshed, retrying request")
+            else:
+                self.token = None
+                if not await self._login():
+                    _LOGGER.error("Re-authentication failed")
+                    raise UpdateFailed("Re-authentication failed")
+                _LOGGER.info("Re-authentication successful, retrying request")
+            headers["Authorization"] = f"Bearer {self.token}"
+
     async def close(self):
-        """Close the API session."""
-        # Session is managed by Home Assistant, no need to close
+        """Close the API session if this client created it."""
+        if self._owns_session:
+            await self.session.close()
 
 
 class HannaCloudCoordinator(DataUpdateCoordinator):
@@ -361,14 +526,30 @@ class HannaCloudCoordinator(DataUpdateCoordinator):
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
         """Initialize the coordinator."""
+        # Dedicated session so the TLS connection to hannacloud.com stays warm between polls
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ssl=get_default_context(),
+                keepalive_timeout=360,
+                ttl_dns_cache=3600,
+                limit_per_host=4,
+            )
+        )
         self.api = HannaCloudAPI(
-            async_get_clientsession(hass),
+            hass,
+            session,
             entry.data[CONF_EMAIL],
-            entry.data[CONF_PASSWORD]
+            entry.data[CONF_PASSWORD],
+            owns_session=True,
         )
 
         update_interval = timedelta(minutes=entry.options.get(CONF_UPDATE_INTERVAL, 5))
 
+        # The device list is refreshed every DEVICES_REFRESH_INTERVAL, readings every tick.
+        # (fetch time, devices) from the last device list refresh
+        self._devices_cache: tuple[float, list] | None = None
+        self._cached_ids: tuple[str, ...] = ()
+
         super().__init__(
             hass,
             _LOGGER,
@@ -376,22 +557,55 @@ class HannaCloudCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
+    def _cache_devices(self, devices: list) -> bool:
+        """Store a fresh device list; return True if the device IDs changed."""
+        # Parent and child devices can share IDs; request each one once, in a stable order
+        device_ids = tuple(sorted(set(map(_get_did, devices))))
+        changed = device_ids != self._cached_ids
+        self._devices_cache = (time.monotonic(), devices)
+        self._cached_ids = device_ids
+        return changed
+
     async def _async_update_data(self):
         """Fetch data from API."""
         try:
-            devices = await self.api.get_devices()
+            readings = None
+            cache = self._devices_cache
+            if cache is not None and time.monotonic() - cache[0] < DEVICES_REFRESH_INTERVAL * 60:
+                # Device list is still fresh, only the readings are needed
+                devices = cache[1]
+            elif self._cached_ids:
+                # Refresh the device list while fetching readings for the known devices;
+                # the task group cancels the other request as soon as one fails
+                try:
+                    async with asyncio.TaskGroup() as group:
+                        devices_task = group.create_task(self.api.get_devices())
+                        readings_task = group.create_task(self.api.get_device_readings(self._cached_ids))
+                except ExceptionGroup as err:
+                    raise err.exceptions[0] from None
+                devices = devices_task.result()
+                readings = readings_task.result()
+                if self._cache_devices(devices):
+                    readings = None
+            else:
+                devices = await self.api.get_devices()
+                self._cache_devices(devices)
+
             if not devices:
                 return {"devices": [], "readings": {}}
 
-            device_ids = [device["DID"] for device in devices]
-            _LOGGER.debug(f"Fetching readings for devices: {device_ids}")
+            if readings is None:
+                _LOGGER.debug("Fetching readings for devices: %s", self._cached_ids)
+                readings = await self.api.get_device_readings(self._cached_ids)
+            _LOGGER.debug("Received readings: %s", readings)
 
-            readings = await self.api.get_device_readings(device_ids)
-            _LOGGER.debug(f"Received readings: {readings}")
+            _normalize_readings(readings)
 
             return {
                 "devices": devices,
                 "readings": readings
             }
         except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}")
\ No newline at end of file
+            self._devices_cache = None
+            self._cached_ids = ()
+            raise UpdateFailed(f"Error communicating with API: {err}")
@@ -1,9 +1,9 @@
 """Config flow for Hanna Cloud integration."""
+import asyncio
 import logging
 from typing import Any
 
 import aiohttp
-import async_timeout
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
@@ -12,6 +12,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from . import HannaCloudAPI, HannaCloudConnectionError
 from .const import CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,119 +27,23 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    import base64
-    import random
-    import string
-
-    # The AES key found in Hanna Cloud JavaScript
-    key_base64 = "MzJmODBmMDU0ZTAyNDFjYWM0YTVhOGQxY2ZlZTkwMDM="
+    api = HannaCloudAPI(
+        hass,
+        async_get_clientsession(hass),
+        data[CONF_EMAIL],
+        data[CONF_PASSWORD]
+    )
 
     try:
-        from Crypto.Cipher import AES
-        from Crypto.Util.Padding import pad
-    except ImportError:
-        raise CannotConnect
-
-    def hanna_encrypt(plaintext: str) -> str:
-        """Encrypt credentials using Hanna Cloud method."""
-        key = base64.b64decode(key_base64)
-
-        # Generate 16-character random IV (letters + digits)
-        chars = string.ascii_letters + string.digits
-        iv = "".join(random.choice(chars) for _ in range(16))
-
-        # AES-256-CBC encryption
-        cipher = AES.new(key, AES.MODE_CBC, iv.encode())
-        padded = pad(plaintext.encode(), AES.block_size)
-        encrypted = cipher.encrypt(padded)
-
-        # Return IV:encrypted_hex
-        return f"{iv}:{encrypted.hex()}"
-
-    session = async_get_clientsession(hass)
-
-    # Encrypt credentials
-    encoded_email = hanna_encrypt(data[CONF_EMAIL])
-    encoded_password = hanna_encrypt(data[CONF_PASSWORD])
-
-    login_query = {
-        "operationName": "Login",
-        "variables": {
-            "email": encoded_email,
-            "password": encoded_password,
-            "userLanguage": "German",
-            "source": "web"
-        },
-        "query": """query Login($email: String!, $password: String!, $userLanguage: String!, $source: String) {
-            login(
-                email: $email
-                password: $password
-                language: $userLanguage
-                source: $source
-            ) {
-                token
-                tokenType
-                __typename
-            }
-        }"""
-    }
+        authenticated = await api.authenticate()
+    except (aiohttp.ClientError, asyncio.TimeoutError, HannaCloudConnectionError) as err:
+        _LOGGER.error("Error connecting to Hanna Cloud: %s", err)
+        raise CannotConnect from err
 
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "*/*",
-        "Accept-Language": "en-US,en;q=0.9,de;q=0.8",
-        "Origin": "https://hannacloud.com",
-        "Referer": "https://hannacloud.com/login",
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
-    }
+    if not authenticated:
+        raise InvalidAuth
 
-    try:
-        async with async_timeout.timeout(10):
-            async with session.post(
-                "https://hannacloud.com/api/auth",
-                json=login_query,
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    response_data = await response.json()
-                    _LOGGER.debug("Validation response: %s", response_data)
-
-                    # Check for errors first
-                    if "errors" in response_data and response_data["errors"]:
-                        error_msg = response_data["errors"][0].get("message", "Unknown error")
-                        _LOGGER.error("API returned error during validation: %s", error_msg)
-                        raise InvalidAuth
-
-                    # Handle both array and object responses
-                    if (response_data and "data" in response_data and response_data["data"] and
-                        "login" in response_data["data"]):
-                        login_data = response_data["data"]["login"]
-                        token = None
-
-                        if isinstance(login_data, list) and len(login_data) > 0:
-                            # Array response (what we expect)
-                            token = login_data[0].get("token")
-                        elif isinstance(login_data, dict):
-                            # Object response (fallback)
-                            token = login_data.get("token")
-
-                        if token:
-                            return {"title": f"Hanna Cloud ({data[CONF_EMAIL]})"}
-                        else:
-                            _LOGGER.error("No token in validation response: %s", login_data)
-                            raise InvalidAuth
-                    else:
-                        _LOGGER.error("No login data in validation response: %s", response_data)
-                        raise InvalidAuth
-                else:
-                    response_text = await response.text()
-                    _LOGGER.error("Validation failed: %s - %s", response.status, response_text)
-                    if response.status == 401:
-                        raise InvalidAuth
-                    raise CannotConnect
-    except Exception as err:
-        _LOGGER.error("Error connecting to Hanna Cloud: %s", err)
-        raise CannotConnect
+    return {"title": f"Hanna Cloud ({data[CONF_EMAIL]})"}
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
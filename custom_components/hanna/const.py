@@ -7,6 +7,7 @@ CONF_UPDATE_INTERVAL = "update_interval"
 
 # Default values
 DEFAULT_UPDATE_INTERVAL = 5  # minutes
+DEVICES_REFRESH_INTERVAL = 30  # minutes; the device list changes rarely
 
 # Device classes
 DEVICE_CLASS_PH = "ph"
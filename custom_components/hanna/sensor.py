@@ -1,10 +1,9 @@
 """Sensor platform for Hanna Cloud integration."""
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
-from dateutil import parser as date_parser
+from abc import abstractmethod
+from collections.abc import Iterator
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -14,12 +13,11 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    CONF_EMAIL,
     UnitOfTemperature,
     UnitOfElectricPotential,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -41,6 +39,39 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map sensor types to parameter names
+_PARAMETER_MAP = {
+    "pH": "ph",
+    "Temperature": "temp",
+    "Redox": "orp",
+    "Chlorine": "cl",
+    "AcidBase": "acidBase"
+}
+
+# Sensor name -> unique_id suffix for every sensor this platform creates
+_UID_SUFFIX = {
+    "pH": "ph",
+    "Temperature": "temperature",
+    "Redox": "redox",
+    "Chlorine": "chlorine",
+    "AcidBase": "acidbase",
+    "pH Pump": "ph_pump",
+    "Chlorine Pump": "chlorine_pump",
+    "pH Last Dosed": "ph_last_dosed",
+    "Chlorine Last Dosed": "chlorine_last_dosed",
+    "pH Calibration Date": "ph_calibration_date",
+    "ORP Calibration Date": "orp_calibration_date",
+    "pH Slope": "ph_slope",
+    "pH Offset": "ph_offset",
+    "Status": "status",
+}
+
+# Marks an entity whose state has not been computed yet
+_UNSET = object()
+
+# Shared stand-in for missing readings data; never mutated
+_NO_READINGS: dict[str, Any] = {}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,392 +81,345 @@ async def async_setup_entry(
     """Set up Hanna Cloud sensors from a config entry."""
     coordinator: HannaCloudCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities = []
+    entities = list(_iter_entities(coordinator))
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Adding %s entities: %s", len(entities), [e.name for e in entities])
+    async_add_entities(entities)
+
+
+def _iter_entities(coordinator: HannaCloudCoordinator) -> Iterator[SensorEntity]:
+    """Yield the sensors for every device known to the coordinator."""
+    if not coordinator.data or "devices" not in coordinator.data:
+        return
 
-    if coordinator.data and "devices" in coordinator.data:
-        for device in coordinator.data["devices"]:
+    for device in coordinator.data["devices"]:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             device_id = device["DID"]
-            device_name = device.get("deviceName") or device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
-
-            _LOGGER.debug(f"Setting up sensors for device {device_id}: {device_name}")
-
-            # Always create these standard sensors for BL12x devices
-            if device.get("modelGroup") == "BL12x":
-                # Main measurement sensors
-                entities.extend([
-                    HannaCloudSensor(
-                        coordinator,
-                        device,
-                        "pH",
-                        UNIT_PH,
-                        DEVICE_CLASS_PH,
-                        config_entry.data[CONF_EMAIL]
-                    ),
-                    HannaCloudSensor(
-                        coordinator,
-                        device,
-                        "Temperature",
-                        UnitOfTemperature.CELSIUS,
-                        SensorDeviceClass.TEMPERATURE,
-                        config_entry.data[CONF_EMAIL]
-                    ),
-                    HannaCloudSensor(
-                        coordinator,
-                        device,
-                        "Redox",
-                        UNIT_MV,
-                        SensorDeviceClass.VOLTAGE,
-                        config_entry.data[CONF_EMAIL]
-                    ),
-                    HannaCloudSensor(
-                        coordinator,
-                        device,
-                        "Chlorine",
-                        "ppm",
-                        None,
-                        config_entry.data[CONF_EMAIL]
-                    ),
-                    HannaCloudSensor(
-                        coordinator,
-                        device,
-                        "AcidBase",
-                        "L",
-                        UnitOfVolume.LITERS,
-                        config_entry.data[CONF_EMAIL]
-                    )
-                ])
-
-                # Pump status sensors
-                entities.extend([
-                    HannaCloudPumpSensor(
-                        coordinator,
-                        device,
-                        "pH Pump",
-                        "phPumpColor",
-                        config_entry.data[CONF_EMAIL]
-                    ),
-                    HannaCloudPumpSensor(
-                        coordinator,
-                        device,
-                        "Chlorine Pump",
-                        "clPumpColor",
-                        config_entry.data[CONF_EMAIL]
-                    )
-                ])
-
-                # Last dosed volume sensors
-                entities.extend([
-                    HannaCloudDosedVolumeSensor(
-                        coordinator,
-                        device,
-                        "pH Last Dosed",
-                        "acidBase",
-                        config_entry.data[CONF_EMAIL]
-                    ),
-                    HannaCloudDosedVolumeSensor(
-                        coordinator,
-                        device,
-                        "Chlorine Last Dosed",
-                        "cl",
-                        config_entry.data[CONF_EMAIL]
-                    )
-                ])
-
-                # Calibration info sensors (GLP)
-                entities.extend([
-                    HannaCloudCalibrationSensor(
-                        coordinator,
-                        device,
-                        "pH Calibration Date",
-                        "pHDateTime",
-                        None,
-                        None,  # Don't use TIMESTAMP device class
-                        config_entry.data[CONF_EMAIL]
-                    ),
-                    HannaCloudCalibrationSensor(
-                        coordinator,
-                        device,
-                        "ORP Calibration Date",
-                        "orpDateTime",
-                        None,
-                        None,  # Don't use TIMESTAMP device class
-                        config_entry.data[CONF_EMAIL]
-                    ),
-                    HannaCloudCalibrationSensor(
-                        coordinator,
-                        device,
-                        "pH Slope",
-                        "pHSlope",
-                        "%",
-                        None,
-                        config_entry.data[CONF_EMAIL]
-                    ),
-                    HannaCloudCalibrationSensor(
-                        coordinator,
-                        device,
-                        "pH Offset",
-                        "pHOffset",
-                        UNIT_MV,
-                        SensorDeviceClass.VOLTAGE,
-                        config_entry.data[CONF_EMAIL]
-                    )
-                ])
-
-            # Always add a status sensor for each device
-            entities.append(
-                HannaCloudStatusSensor(
-                    coordinator,
-                    device,
-                    config_entry.data[CONF_EMAIL]
-                )
+            _LOGGER.debug(
+                "Setting up sensors for device %s: %s",
+                device_id,
+                device.get("deviceName") or device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
             )
 
-    _LOGGER.debug(f"Adding {len(entities)} entities: {[e.name for e in entities]}")
-    async_add_entities(entities)
+        # Always create these standard sensors for BL12x devices
+        if device.get("modelGroup") == "BL12x":
+            # Main measurement sensors
+            yield HannaCloudSensor(
+                coordinator,
+                device,
+                "pH",
+                UNIT_PH,
+                DEVICE_CLASS_PH,
+            )
+            yield HannaCloudSensor(
+                coordinator,
+                device,
+                "Temperature",
+                UnitOfTemperature.CELSIUS,
+                SensorDeviceClass.TEMPERATURE,
+            )
+            yield HannaCloudSensor(
+                coordinator,
+                device,
+                "Redox",
+                UNIT_MV,
+                SensorDeviceClass.VOLTAGE,
+            )
+            yield HannaCloudSensor(
+                coordinator,
+                device,
+                "Chlorine",
+                "ppm",
+                None,
+            )
+            yield HannaCloudSensor(
+                coordinator,
+                device,
+                "AcidBase",
+                "L",
+                UnitOfVolume.LITERS,
+            )
 
+            # Pump status sensors
+            yield HannaCloudPumpSensor(
+                coordinator,
+                device,
+                "pH Pump",
+                "phPumpColor",
+            )
+            yield HannaCloudPumpSensor(
+                coordinator,
+                device,
+                "Chlorine Pump",
+                "clPumpColor",
+            )
 
-class HannaCloudSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a Hanna Cloud sensor."""
+            # Last dosed volume sensors
+            yield HannaCloudDosedVolumeSensor(
+                coordinator,
+                device,
+                "pH Last Dosed",
+                "acidBase",
+            )
+            yield HannaCloudDosedVolumeSensor(
+                coordinator,
+                device,
+                "Chlorine Last Dosed",
+                "cl",
+            )
+
+            # Calibration info sensors (GLP)
+            yield HannaCloudCalibrationSensor(
+                coordinator,
+                device,
+                "pH Calibration Date",
+                "pHDateTime",
+                None,
+                None,  # Don't use TIMESTAMP device class
+            )
+            yield HannaCloudCalibrationSensor(
+                coordinator,
+                device,
+                "ORP Calibration Date",
+                "orpDateTime",
+                None,
+                None,  # Don't use TIMESTAMP device class
+            )
+            yield HannaCloudCalibrationSensor(
+                coordinator,
+                device,
+                "pH Slope",
+                "pHSlope",
+                "%",
+                None,
+            )
+            yield HannaCloudCalibrationSensor(
+                coordinator,
+                device,
+                "pH Offset",
+                "pHOffset",
+                UNIT_MV,
+                SensorDeviceClass.VOLTAGE,
+            )
+
+        # Always add a status sensor for each device
+        yield HannaCloudStatusSensor(
+            coordinator,
+            device,
+        )
+
+
+class _HannaBaseEntity(CoordinatorEntity, SensorEntity):
+    """Base class for a sensor belonging to one Hanna Cloud device."""
+
+    __slots__ = (
+        "_device",
+        "_device_id",
+        "_dinfo",
+        "_readings",
+        "_status",
+        "_glp",
+        "_dosed",
+        "_params_by_name",
+    )
 
     def __init__(
         self,
         coordinator: HannaCloudCoordinator,
         device: dict,
-        sensor_type: str,
-        unit: str,
-        device_class: str,
-        email: str,
+        sensor_name: str,
     ) -> None:
-        """Initialize the sensor."""
+        """Initialize the entity and its device information."""
         super().__init__(coordinator)
 
         self._device = device
-        self._sensor_type = sensor_type
-        self._unit = unit
-        self._device_class = device_class
-        self._email = email
+        self._dinfo = dinfo = device.get("DINFO") or {}
 
         device_id = device["DID"]
-        device_name = device.get("deviceName") or device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
-
-        self._attr_name = f"{device_name} {sensor_type}"
-        self._attr_unique_id = f"{device_id}_{sensor_type.lower().replace(' ', '_')}"
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        if device_class in [DEVICE_CLASS_PH, SensorDeviceClass.TEMPERATURE, SensorDeviceClass.VOLTAGE]:
-            self._attr_state_class = SensorStateClass.MEASUREMENT
+        device_name = device.get("deviceName") or dinfo.get("deviceName", f"Device {device_id}")
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device_id = self._device["DID"]
-        device_name = self._device.get("deviceName") or self._device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
-        model_group = self._device.get("modelGroup", "Unknown")
-
-        return DeviceInfo(
+        self._device_id = device_id
+        self._readings = _UNSET
+        self._attr_name = f"{device_name} {sensor_name}"
+        unique_suffix = _UID_SUFFIX.get(sensor_name) or sensor_name.lower().replace(' ', '_')
+        self._attr_unique_id = f"{device_id}_{unique_suffix}"
+        self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device_id)},
             name=device_name,
             manufacturer="Hanna Instruments",
-            model=model_group,
-            sw_version=self._device.get("DINFO", {}).get("deviceVersion"),
+            model=device.get("modelGroup", "Unknown"),
+            sw_version=dinfo.get("deviceVersion"),
         )
 
-    @property
-    def native_value(self) -> float | None:
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state before the entity is first written."""
+        self._refresh_state()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._refresh_state()
+        super()._handle_coordinator_update()
+
+    def _refresh_state(self) -> None:
+        """Recompute the cached state unless this device's readings are unchanged."""
+        readings = (self.coordinator.data or {}).get("readings", {}).get(self._device_id) or _NO_READINGS
+        # Every successful poll parses a new readings object, so identity means nothing changed
+        if readings is self._readings:
+            return
+        self._readings = readings
+
+        # The coordinator guarantees these are dicts whenever readings exist
+        messages = readings["messages"] if readings else _NO_READINGS
+        self._status = messages.get("status", _NO_READINGS)
+        self._glp = messages.get("glp", _NO_READINGS)
+        self._dosed = messages.get("lastDosedVolumes", _NO_READINGS)
+        self._params_by_name = messages.get("_params_by_name", _NO_READINGS)
+
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Refresh the cached state from the latest coordinator data."""
+        self._attr_native_value = self._compute_native_value()
+
+    @abstractmethod
+    def _compute_native_value(self) -> str | float | None:
         """Return the native value of the sensor."""
-        if not self.coordinator.data:
-            return None
 
-        device_id = self._device["DID"]
-        readings = self.coordinator.data.get("readings", {}).get(device_id, {})
 
-        if not readings or "messages" not in readings:
-            return None
+class HannaCloudSensor(_HannaBaseEntity):
+    """Representation of a Hanna Cloud sensor."""
 
-        messages = readings["messages"]
-
-        # Check if messages has the new "parameters" structure
-        if isinstance(messages, dict) and "parameters" in messages:
-            parameters = messages["parameters"]
-            if isinstance(parameters, list):
-                _LOGGER.debug(f"Device {device_id} parameters for {self._sensor_type}: {parameters}")
-
-                # Map sensor types to parameter names
-                parameter_map = {
-                    "pH": "ph",
-                    "Temperature": "temp",
-                    "Redox": "orp",
-                    "Chlorine": "cl",
-                    "AcidBase": "acidBase"
-                }
-
-                target_param = parameter_map.get(self._sensor_type)
-                if target_param:
-                    for param in parameters:
-                        if isinstance(param, dict) and param.get("name") == target_param:
-                            try:
-                                value = param.get("value")
-                                if value is not None:
-                                    return float(value)
-                            except (ValueError, TypeError) as e:
-                                _LOGGER.warning(f"Could not convert {target_param} value '{value}' to float: {e}")
-                                return None
+    __slots__ = (
+        "_target_param",
+    )
 
-        return None
+    def __init__(
+        self,
+        coordinator: HannaCloudCoordinator,
+        device: dict,
+        sensor_type: str,
+        unit: str,
+        device_class: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, device, sensor_type)
+
+        self._target_param = _PARAMETER_MAP.get(sensor_type)
+
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        if device_class in [DEVICE_CLASS_PH, SensorDeviceClass.TEMPERATURE, SensorDeviceClass.VOLTAGE]:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        attrs = {
-            ATTR_DEVICE_ID: self._device["DID"],
-            ATTR_DEVICE_NAME: self._device.get("deviceName") or self._device.get("DINFO", {}).get("deviceName"),
-            ATTR_MODEL_GROUP: self._device.get("modelGroup"),
-            ATTR_STATUS: self._device.get("status"),
-            ATTR_LAST_UPDATED: self._device.get("lastUpdated"),
+        # The device dict is captured at setup, so these attributes never change
+        self._attr_extra_state_attributes = {
+            key: value
+            for key, value in (
+                (ATTR_DEVICE_ID, device["DID"]),
+                (ATTR_DEVICE_NAME, device.get("deviceName") or self._dinfo.get("deviceName")),
+                (ATTR_MODEL_GROUP, device.get("modelGroup")),
+                (ATTR_TANK_NAME, self._dinfo.get("tankName") or None),
+                (ATTR_BATTERY_STATUS, device.get("batteryStatus") or None),
+                (ATTR_STATUS, device.get("status")),
+                (ATTR_LAST_UPDATED, device.get("lastUpdated")),
+            )
+            if value is not None
         }
 
-        # Add tank information if available
-        if self._device.get("DINFO", {}).get("tankName"):
-            attrs[ATTR_TANK_NAME] = self._device["DINFO"]["tankName"]
+    def _compute_native_value(self) -> float | None:
+        """Return the native value of the sensor."""
+        if not self._readings:
+            return None
 
-        # Add battery status if available
-        if self._device.get("batteryStatus"):
-            attrs[ATTR_BATTERY_STATUS] = self._device["batteryStatus"]
+        # The coordinator indexes the "parameters" list by name
+        params_by_name = self._params_by_name
+        _LOGGER.debug("Device %s parameters for %s: %s", self._device_id, self._target_param, params_by_name)
 
-        return {k: v for k, v in attrs.items() if v is not None}
+        target_param = self._target_param
+        if target_param:
+            value = params_by_name.get(target_param)
+            if value is not None:
+                try:
+                    return float(value)
+                except (ValueError, TypeError) as e:
+                    _LOGGER.warning(f"Could not convert {target_param} value '{value}' to float: {e}")
+
+        return None
 
 
-class HannaCloudPumpSensor(CoordinatorEntity, SensorEntity):
+class HannaCloudPumpSensor(_HannaBaseEntity):
     """Representation of a pump status sensor."""
 
+    __slots__ = (
+        "_pump_key",
+    )
+
     def __init__(
         self,
         coordinator: HannaCloudCoordinator,
         device: dict,
         sensor_name: str,
         pump_key: str,
-        email: str,
     ) -> None:
         """Initialize the pump sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device, sensor_name)
 
-        self._device = device
-        self._sensor_name = sensor_name
         self._pump_key = pump_key
-        self._email = email
-
-        device_id = device["DID"]
-        device_name = device.get("deviceName") or device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
 
-        self._attr_name = f"{device_name} {sensor_name}"
-        self._attr_unique_id = f"{device_id}_{sensor_name.lower().replace(' ', '_')}"
         self._attr_icon = "mdi:pump"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device_id = self._device["DID"]
-        device_name = self._device.get("deviceName") or self._device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
-        model_group = self._device.get("modelGroup", "Unknown")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_name,
-            manufacturer="Hanna Instruments",
-            model=model_group,
-            sw_version=self._device.get("DINFO", {}).get("deviceVersion"),
-        )
-
-    @property
-    def native_value(self) -> str | None:
+    def _compute_native_value(self) -> str | None:
         """Return the pump status."""
-        if not self.coordinator.data:
-            return None
-
-        device_id = self._device["DID"]
-        readings = self.coordinator.data.get("readings", {}).get(device_id, {})
-
-        if readings and "messages" in readings:
-            messages = readings["messages"]
-            if isinstance(messages, dict) and "status" in messages:
-                status_obj = messages["status"]
-                if isinstance(status_obj, dict):
-                    return status_obj.get(self._pump_key, "Unknown")
-
-        return "Unknown"
+        return self._status.get(self._pump_key, "Unknown")
 
 
-class HannaCloudDosedVolumeSensor(CoordinatorEntity, SensorEntity):
+class HannaCloudDosedVolumeSensor(_HannaBaseEntity):
     """Representation of a last dosed volume sensor."""
 
+    __slots__ = (
+        "_dose_key",
+    )
+
     def __init__(
         self,
         coordinator: HannaCloudCoordinator,
         device: dict,
         sensor_name: str,
         dose_key: str,
-        email: str,
     ) -> None:
         """Initialize the dosed volume sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device, sensor_name)
 
-        self._device = device
-        self._sensor_name = sensor_name
         self._dose_key = dose_key
-        self._email = email
-
-        device_id = device["DID"]
-        device_name = device.get("deviceName") or device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
 
-        self._attr_name = f"{device_name} {sensor_name}"
-        self._attr_unique_id = f"{device_id}_{sensor_name.lower().replace(' ', '_')}"
         self._attr_native_unit_of_measurement = "L"
         self._attr_device_class = SensorDeviceClass.VOLUME
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         self._attr_icon = "mdi:beaker"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device_id = self._device["DID"]
-        device_name = self._device.get("deviceName") or self._device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
-        model_group = self._device.get("modelGroup", "Unknown")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_name,
-            manufacturer="Hanna Instruments",
-            model=model_group,
-            sw_version=self._device.get("DINFO", {}).get("deviceVersion"),
-        )
-
-    @property
-    def native_value(self) -> float | None:
+    def _compute_native_value(self) -> float | None:
         """Return the last dosed volume."""
-        if not self.coordinator.data:
-            return None
-
-        device_id = self._device["DID"]
-        readings = self.coordinator.data.get("readings", {}).get(device_id, {})
-
-        if readings and "messages" in readings:
-            messages = readings["messages"]
-            if isinstance(messages, dict) and "lastDosedVolumes" in messages:
-                volumes = messages["lastDosedVolumes"]
-                if isinstance(volumes, dict):
-                    try:
-                        value = volumes.get(self._dose_key)
-                        if value is not None:
-                            return float(value)
-                    except (ValueError, TypeError):
-                        return None
+        value = self._dosed.get(self._dose_key)
+        if value is not None:
+            try:
+                return float(value)
+            except (ValueError, TypeError):
+                return None
 
         return None
 
 
-class HannaCloudCalibrationSensor(CoordinatorEntity, SensorEntity):
+class HannaCloudCalibrationSensor(_HannaBaseEntity):
     """Representation of a calibration info sensor (GLP data)."""
 
+    __slots__ = (
+        "_glp_key",
+        "_is_datetime",
+    )
+
     def __init__(
         self,
         coordinator: HannaCloudCoordinator,
@@ -444,168 +428,100 @@ class HannaCloudCalibrationSensor(CoordinatorEntity, SensorEntity):
         glp_key: str,
         unit: str,
         device_class: str,
-        email: str,
     ) -> None:
         """Initialize the calibration sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device, sensor_name)
 
-        self._device = device
-        self._sensor_name = sensor_name
         self._glp_key = glp_key
-        self._email = email
-
-        device_id = device["DID"]
-        device_name = device.get("deviceName") or device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
+        self._is_datetime = "DateTime" in glp_key
 
-        self._attr_name = f"{device_name} {sensor_name}"
-        self._attr_unique_id = f"{device_id}_{sensor_name.lower().replace(' ', '_')}"
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = device_class
         self._attr_icon = "mdi:calendar-clock"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device_id = self._device["DID"]
-        device_name = self._device.get("deviceName") or self._device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
-        model_group = self._device.get("modelGroup", "Unknown")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_name,
-            manufacturer="Hanna Instruments",
-            model=model_group,
-            sw_version=self._device.get("DINFO", {}).get("deviceVersion"),
-        )
-
-    @property
-    def native_value(self) -> str | float | None:
+    def _compute_native_value(self) -> str | float | None:
         """Return the calibration value."""
-        if not self.coordinator.data:
-            return None
-
-        device_id = self._device["DID"]
-        readings = self.coordinator.data.get("readings", {}).get(device_id, {})
-
-        if readings and "messages" in readings:
-            messages = readings["messages"]
-            if isinstance(messages, dict) and "glp" in messages:
-                glp = messages["glp"]
-                if isinstance(glp, dict):
-                    value = glp.get(self._glp_key)
-                    if value is not None:
-                        # Handle datetime fields - keep as string for display
-                        if "DateTime" in self._glp_key:
-                            return str(value)
-                        else:
-                            try:
-                                return float(value)
-                            except (ValueError, TypeError):
-                                return value
+        value = self._glp.get(self._glp_key)
+        if value is not None:
+            # Handle datetime fields - keep as string for display
+            if self._is_datetime:
+                return str(value)
+            try:
+                return float(value)
+            except (ValueError, TypeError):
+                return value
 
         return None
 
 
-class HannaCloudStatusSensor(CoordinatorEntity, SensorEntity):
+class HannaCloudStatusSensor(_HannaBaseEntity):
     """Representation of a Hanna Cloud device status sensor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: HannaCloudCoordinator,
         device: dict,
-        email: str,
     ) -> None:
         """Initialize the status sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device, "Status")
 
-        self._device = device
-        self._email = email
-
-        device_id = device["DID"]
-        device_name = device.get("deviceName") or device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
-
-        self._attr_name = f"{device_name} Status"
-        self._attr_unique_id = f"{device_id}_status"
         self._attr_icon = "mdi:water-check"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device_id = self._device["DID"]
-        device_name = self._device.get("deviceName") or self._device.get("DINFO", {}).get("deviceName", f"Device {device_id}")
-        model_group = self._device.get("modelGroup", "Unknown")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_name,
-            manufacturer="Hanna Instruments",
-            model=model_group,
-            sw_version=self._device.get("DINFO", {}).get("deviceVersion"),
-        )
+    def _update_from_coordinator(self) -> None:
+        """Refresh the cached state and attributes from the latest coordinator data."""
+        super()._update_from_coordinator()
+        self._attr_extra_state_attributes = self._compute_extra_state_attributes()
 
-    @property
-    def native_value(self) -> str | None:
+    def _compute_native_value(self) -> str | None:
         """Return the native value of the sensor."""
         # Try to get status from readings first
-        if self.coordinator.data:
-            device_id = self._device["DID"]
-            readings = self.coordinator.data.get("readings", {}).get(device_id, {})
-            if readings and "messages" in readings:
-                messages = readings["messages"]
-                if isinstance(messages, dict) and "status" in messages:
-                    status_obj = messages["status"]
-                    if isinstance(status_obj, dict):
-                        # Return the overall status color or a summary
-                        status_color = status_obj.get("StatusColor", "Unknown")
-                        return status_color
+        if status_obj := self._status:
+            # Return the overall status color or a summary
+            return status_obj.get("StatusColor", "Unknown")
 
         # Fallback to device status
         return self._device.get("status", "Unknown")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        attrs = {
-            ATTR_DEVICE_ID: self._device["DID"],
-            ATTR_DEVICE_NAME: self._device.get("deviceName") or self._device.get("DINFO", {}).get("deviceName"),
-            ATTR_MODEL_GROUP: self._device.get("modelGroup"),
-            ATTR_LAST_UPDATED: self._device.get("lastUpdated"),
-        }
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes, leaving out any that are None."""
+        device = self._device
+        attrs = {ATTR_DEVICE_ID: device["DID"]}
+
+        if (device_name := device.get("deviceName") or self._dinfo.get("deviceName")) is not None:
+            attrs[ATTR_DEVICE_NAME] = device_name
+        if (model_group := device.get("modelGroup")) is not None:
+            attrs[ATTR_MODEL_GROUP] = model_group
+        if (last_updated := device.get("lastUpdated")) is not None:
+            attrs[ATTR_LAST_UPDATED] = last_updated
 
         # Add tank information if available
-        if self._device.get("DINFO", {}).get("tankName"):
-            attrs[ATTR_TANK_NAME] = self._device["DINFO"]["tankName"]
+        if tank_name := self._dinfo.get("tankName"):
+            attrs[ATTR_TANK_NAME] = tank_name
 
         # Add battery status if available
-        if self._device.get("batteryStatus"):
-            attrs[ATTR_BATTERY_STATUS] = self._device["batteryStatus"]
+        if battery_status := device.get("batteryStatus"):
+            attrs[ATTR_BATTERY_STATUS] = battery_status
 
         # Add latest reading data
-        if self.coordinator.data:
-            device_id = self._device["DID"]
-            readings = self.coordinator.data.get("readings", {}).get(device_id, {})
-            if readings:
-                attrs["last_reading_time"] = readings.get("DT")
-                if "messages" in readings:
-                    messages = readings["messages"]
-                    if isinstance(messages, dict):
-                        # Add status details if available
-                        if "status" in messages:
-                            status_obj = messages["status"]
-                            if isinstance(status_obj, dict):
-                                for key, value in status_obj.items():
-                                    attrs[f"status_{key.lower()}"] = value
-
-                        # Add alarm information
-                        if "alarms" in messages:
-                            attrs["alarms"] = messages["alarms"]
-                        if "warnings" in messages:
-                            attrs["warnings"] = messages["warnings"]
-                        if "errors" in messages:
-                            attrs["errors"] = messages["errors"]
-
-                        # Add connection state
-                        if "connectionState" in messages:
-                            attrs["connection_state"] = messages["connectionState"]
-
-        return {k: v for k, v in attrs.items() if v is not None}
\ No newline at end of file
+        if readings := self._readings:
+            if (reading_time := readings.get("DT")) is not None:
+                attrs["last_reading_time"] = reading_time
+            messages = readings["messages"]
+
+            # Add status details if available
+            for key, value in self._status.items():
+                if value is not None:
+                    attrs[f"status_{key.lower()}"] = value
+
+            # Add alarm information
+            for key in ("alarms", "warnings", "errors"):
+                if (value := messages.get(key)) is not None:
+                    attrs[key] = value
+
+            # Add connection state
+            if (connection_state := messages.get("connectionState")) is not None:
+                attrs["connection_state"] = connection_state
+
+        return attrs
\ No newline at end of file